@@ -6,13 +6,13 @@ Demo script to showcase the enhanced features
 import sys
 import time
 import os
-from tools.user_interface import UserInterface, ProgressTracker, NetworkStatusIndicator
-from tools.config_manager import ConfigManager
+from tools.user_interface import ProgressTracker, NetworkStatusIndicator, get_ui, write_lines
+from tools.config_manager import get_config_manager
 from colorama import Fore
 
 def demo_user_interface():
     """Demonstrate the enhanced user interface"""
-    ui = UserInterface()
+    ui = get_ui()
     
     # Banner
     ui.print_banner()
@@ -35,7 +35,7 @@ def demo_user_interface():
 
 def demo_progress_tracking():
     """Demonstrate progress tracking"""
-    ui = UserInterface()
+    ui = get_ui()
     ui.print_section_header("Progress Tracking Demo")
     
     progress = ProgressTracker()
@@ -53,9 +53,7 @@ def demo_progress_tracking():
         progress.start_episode(i, episode_title)
         
         # Simulate download time
-        for _ in range(20):
-            time.sleep(0.1)
-            # progress.update_status(f"Downloading... {_*5}%")
+        time.sleep(2.0)
         
         progress.complete_episode()
         time.sleep(0.5)
@@ -64,20 +62,22 @@ def demo_progress_tracking():
 
 def demo_configuration():
     """Demonstrate configuration management"""
-    ui = UserInterface()
+    ui = get_ui()
     ui.print_section_header("Configuration Demo")
     
     print(f"{Fore.LIGHTCYAN_EX}Creating and loading configuration...")
     
-    config_manager = ConfigManager("demo_config.json")
+    config_manager = get_config_manager("demo_config.json")
     config = config_manager.get_config()
     
-    print(f"{Fore.LIGHTGREEN_EX}✅ Configuration loaded:")
-    print(f"{Fore.LIGHTCYAN_EX}  - Max Retries: {config.max_retries}")
-    print(f"{Fore.LIGHTCYAN_EX}  - Timeout: {config.timeout}s")
-    print(f"{Fore.LIGHTCYAN_EX}  - Output Dir: {config.output_directory}")
-    print(f"{Fore.LIGHTCYAN_EX}  - Quality: {config.default_quality}")
-    print(f"{Fore.LIGHTCYAN_EX}  - Concurrent Downloads: {config.max_concurrent_downloads}")
+    write_lines(
+        f"{Fore.LIGHTGREEN_EX}✅ Configuration loaded:",
+        f"{Fore.LIGHTCYAN_EX}  - Max Retries: {config.max_retries}",
+        f"{Fore.LIGHTCYAN_EX}  - Timeout: {config.timeout}s",
+        f"{Fore.LIGHTCYAN_EX}  - Output Dir: {config.output_directory}",
+        f"{Fore.LIGHTCYAN_EX}  - Quality: {config.default_quality}",
+        f"{Fore.LIGHTCYAN_EX}  - Concurrent Downloads: {config.max_concurrent_downloads}",
+    )
     
     # Clean up demo config
     if os.path.exists("demo_config.json"):
@@ -87,7 +87,7 @@ def demo_configuration():
 
 def demo_network_status():
     """Demonstrate network status indicators"""
-    ui = UserInterface()
+    ui = get_ui()
     ui.print_section_header("Network Status Demo")
     
     network = NetworkStatusIndicator()
@@ -135,9 +135,11 @@ def main():
         except Exception as e:
             print(f"\n{Fore.LIGHTRED_EX}Error in {name} demo: {e}")
     
-    print(f"\n{Fore.LIGHTGREEN_EX}✨ Demo completed! Try running:")
-    print(f"{Fore.LIGHTCYAN_EX}  python main_enhanced.py")
-    print(f"{Fore.LIGHTCYAN_EX}  python quick_start.py")
+    write_lines(
+        f"\n{Fore.LIGHTGREEN_EX}✨ Demo completed! Try running:",
+        f"{Fore.LIGHTCYAN_EX}  python main_enhanced.py",
+        f"{Fore.LIGHTCYAN_EX}  python quick_start.py",
+    )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,32 +1,50 @@
 import argparse
-import os
+import functools
 import time
 import sys
+from urllib.parse import urlparse
 
 from colorama import Fore, init
 
 from extractors.general import GeneralExtractor
 from extractors.hianime import HianimeExtractor
 from extractors.instagram import InstagramExtractor
+from tools.functions import clear_screen
 
 # Try to import enhanced features, fallback if not available
 try:
-    from tools.config_manager import ConfigManager
-    from tools.user_interface import UserInterface
+    from tools.config_manager import get_config_manager
+    from tools.user_interface import get_ui
     ENHANCED_FEATURES = True
 except ImportError:
     ENHANCED_FEATURES = False
 
-# Initialize colorama
-init(autoreset=True)
+# Host substring -> extractor, checked in order; anything else uses GeneralExtractor
+_EXTRACTOR_BY_HOST = (
+    ("hianime", HianimeExtractor),
+    ("instagram.com", InstagramExtractor),
+)
+
+
+def _host(link: str) -> str:
+    # Without a scheme urlparse sees no host, so treat bare "site.tld/path" links as network paths
+    try:
+        return urlparse(link if "://" in link else "//" + link).hostname or ""
+    except ValueError:  # Malformed link, e.g. an unclosed IPv6 bracket
+        return ""
+
+
+# Initialize colorama (importing tools.user_interface already did, with autoreset)
+if not ENHANCED_FEATURES:
+    init(autoreset=True)
 
 class Main:
     def __init__(self):
         # Initialize enhanced features if available
         if ENHANCED_FEATURES:
-            self.config_manager = ConfigManager()
+            self.config_manager = get_config_manager()
             self.config = self.config_manager.get_config()
-            self.ui = UserInterface()
+            self.ui = get_ui()
             self.ui.print_banner()
         
         self.args = self.parse_args()
@@ -39,7 +57,7 @@ class Main:
 
     def get_extractor(self):
         if not self.args.link and not self.args.filename:
-            os.system("cls" if os.name == "nt" else "clear")
+            clear_screen()
             
             if ENHANCED_FEATURES:
                 self.ui.print_section_header("Welcome to GDown Downloader")
@@ -58,59 +76,63 @@ class Main:
 
         if not self.args.link and self.args.filename:
             return HianimeExtractor(args=self.args, name=self.args.filename)
-            return HianimeExtractor(args=self.args, name=self.args.filename)
 
-        if "hianime" in self.args.link:
-            return HianimeExtractor(args=self.args)
-        if "instagram.com" in self.args.link:
-            return InstagramExtractor(args=self.args)
+        host = _host(self.args.link)
+        for needle, extractor in _EXTRACTOR_BY_HOST:
+            if needle in host:
+                return extractor(args=self.args)
         return GeneralExtractor(args=self.args)
 
     def parse_args(self):
-        parser = argparse.ArgumentParser(description="Anime downloader options")
-
-        parser.add_argument(
-            "--no-subtitles",
-            action="store_true",
-            help="Skip downloading subtitle files (.vtt)",
-        )
-
-        parser.add_argument(
-            "-o",
-            "--output-dir",
-            type=str,
-            default="output",
-            help="Directory to save downloaded files",
-        )
-
-        parser.add_argument(
-            "-n",
-            "--filename",
-            type=str,
-            default="",
-            help="Used for name of anime, or name of output file when using other extractor",
-        )
-
-        parser.add_argument(
-            "--aria",
-            action="store_true",
-            default=False,
-            help="Use aria2c as external downloader",
-        )
-
-        parser.add_argument(
-            "-l",
-            "--link",
-            type=str,
-            default=None,
-            help="Provide link to desired content",
-        )
-
-        parser.add_argument(
-            "--server", type=str, default=None, help="Streaming Server to download from"
-        )
-
-        return parser.parse_args()
+        return _get_parser().parse_args()
+
+
+@functools.cache
+def _get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Anime downloader options")
+
+    parser.add_argument(
+        "--no-subtitles",
+        action="store_true",
+        help="Skip downloading subtitle files (.vtt)",
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        type=str,
+        default="output",
+        help="Directory to save downloaded files",
+    )
+
+    parser.add_argument(
+        "-n",
+        "--filename",
+        type=str,
+        default="",
+        help="Used for name of anime, or name of output file when using other extractor",
+    )
+
+    parser.add_argument(
+        "--aria",
+        action="store_true",
+        default=False,
+        help="Use aria2c as external downloader",
+    )
+
+    parser.add_argument(
+        "-l",
+        "--link",
+        type=str,
+        default=None,
+        help="Provide link to desired content",
+    )
+
+    parser.add_argument(
+        "--server", type=str, default=None, help="Streaming Server to download from"
+    )
+
+    return parser
 
 
 if __name__ == "__main__":
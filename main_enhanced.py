@@ -5,93 +5,125 @@ Provides smooth user experience with better error handling and progress tracking
 """
 
 import sys
-import os
 import argparse
+import functools
 from typing import Optional
 
-# Add current directory to Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from tools.config_manager import ConfigManager, DownloadConfig
-from tools.user_interface import UserInterface, ProgressTracker, NetworkStatusIndicator
+from tools.config_manager import DownloadConfig, get_config_manager
+from tools.user_interface import UserInterface, ProgressTracker, NetworkStatusIndicator, get_ui, write_lines
 from extractors.hianime import HianimeExtractor
-from colorama import init
 
-# Initialize colorama for Windows
-init(autoreset=True)
+QUALITY_CHOICES = ["best", "worst", "720p", "1080p"]
+
+# Configuration menu readers: each takes (prompt, current value) and returns
+# the new value, or None to leave the setting unchanged
+def _read_text(prompt: str, current):
+    return input(f"{prompt} [{current}]: ").strip() or None
+
+def _read_quality(prompt: str, current):
+    return UserInterface.get_user_choice(prompt, QUALITY_CHOICES)
+
+def _read_flag(prompt: str, current):
+    return UserInterface.confirm_action(prompt, current)
+
+def _int_reader(low: int, high: int):
+    def read(prompt: str, current):
+        try:
+            value = int(input(f"{prompt} [{current}]: "))
+        except ValueError:
+            UserInterface.print_error("Please enter a valid number")
+            return None
+        if low <= value <= high:
+            return value
+        UserInterface.print_error(f"Please enter a number between {low} and {high}")
+        return None
+    return read
+
+@functools.cache
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the command line parser once and reuse it"""
+    # Options that override config.json default to None; run() applies only the ones given
+    parser = argparse.ArgumentParser(
+        description="Enhanced HiAnime Downloader - Fast, Reliable, User-Friendly",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python main_enhanced.py                                    # Interactive mode
+  python main_enhanced.py -n "Demon Slayer"                 # Search for anime
+  python main_enhanced.py -l "https://hianime.nz/watch/..." # Download from link
+  python main_enhanced.py --config                          # Open configuration
+        """
+    )
+    
+    # Basic options
+    parser.add_argument("-n", "--name", help="Name of the anime to search for")
+    parser.add_argument("-l", "--link", help="Direct link to anime page")
+    parser.add_argument("-o", "--output", help="Output directory")
+    
+    # Quality and format options
+    parser.add_argument("--quality", choices=QUALITY_CHOICES, 
+                      help="Video quality preference")
+    parser.add_argument("--no-subs", action="store_true", help="Skip subtitle download")
+    parser.add_argument("--sub-lang", help="Subtitle language")
+    
+    # Advanced options
+    parser.add_argument("--server", help="Preferred server name")
+    parser.add_argument("--headless", action="store_true", help="Run browser in headless mode")
+    parser.add_argument("--config", action="store_true", help="Open configuration menu")
+    parser.add_argument("--max-retries", type=int, help="Maximum retry attempts")
+    
+    # Batch download options
+    parser.add_argument("--batch", help="Batch download file (one anime per line)")
+    parser.add_argument("--start-ep", type=int, help="Starting episode number")
+    parser.add_argument("--end-ep", type=int, help="Ending episode number")
+    
+    return parser
 
 class EnhancedHianimeApp:
     """Enhanced HiAnime Downloader with improved user experience"""
     
+    # (label, DownloadConfig field, prompt, reader) for each editable option in the configuration menu
+    _CONFIG_FIELDS = (
+        ("Output Directory", "output_directory", "Enter new output directory", _read_text),
+        ("Default Quality", "default_quality", "Select default quality:", _read_quality),
+        ("Download Subtitles", "download_subtitles", "Download subtitles by default?", _read_flag),
+        ("Subtitle Language", "subtitle_language", "Enter subtitle language code", _read_text),
+        ("Max Concurrent Downloads", "max_concurrent_downloads", "Enter max concurrent downloads", _int_reader(1, 10)),
+        ("Browser Headless Mode", "headless_browser", "Run browser in headless mode?", _read_flag),
+        ("Max Retry Attempts", "max_retries", "Enter max retry attempts", _int_reader(1, 20)),
+        ("SSL Verification", "verify_ssl", "Enable SSL verification?", _read_flag),
+    )
+    
     def __init__(self):
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
         self.config = self.config_manager.get_config()
-        self.ui = UserInterface()
+        self.ui = get_ui()
         self.progress = ProgressTracker()
         self.network_indicator = NetworkStatusIndicator()
         
     def parse_arguments(self):
         """Parse command line arguments with enhanced options"""
-        parser = argparse.ArgumentParser(
-            description="Enhanced HiAnime Downloader - Fast, Reliable, User-Friendly",
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
-Examples:
-  python main_enhanced.py                                    # Interactive mode
-  python main_enhanced.py -n "Demon Slayer"                 # Search for anime
-  python main_enhanced.py -l "https://hianime.nz/watch/..." # Download from link
-  python main_enhanced.py --config                          # Open configuration
-            """
-        )
-        
-        # Basic options
-        parser.add_argument("-n", "--name", help="Name of the anime to search for")
-        parser.add_argument("-l", "--link", help="Direct link to anime page")
-        parser.add_argument("-o", "--output", help="Output directory", default=self.config.output_directory)
-        
-        # Quality and format options
-        parser.add_argument("--quality", choices=["best", "worst", "720p", "1080p"], 
-                          default=self.config.default_quality, help="Video quality preference")
-        parser.add_argument("--no-subs", action="store_true", help="Skip subtitle download")
-        parser.add_argument("--sub-lang", default=self.config.subtitle_language, help="Subtitle language")
-        
-        # Advanced options
-        parser.add_argument("--server", help="Preferred server name")
-        parser.add_argument("--headless", action="store_true", help="Run browser in headless mode")
-        parser.add_argument("--config", action="store_true", help="Open configuration menu")
-        parser.add_argument("--max-retries", type=int, default=self.config.max_retries, 
-                          help="Maximum retry attempts")
-        
-        # Batch download options
-        parser.add_argument("--batch", help="Batch download file (one anime per line)")
-        parser.add_argument("--start-ep", type=int, help="Starting episode number")
-        parser.add_argument("--end-ep", type=int, help="Ending episode number")
-        
-        return parser.parse_args()
+        return _get_parser().parse_args()
     
     def show_configuration_menu(self):
         """Show interactive configuration menu"""
         self.ui.print_section_header("Configuration Settings")
         
-        config_options = [
-            f"Output Directory: {self.config.output_directory}",
-            f"Default Quality: {self.config.default_quality}",
-            f"Download Subtitles: {'Yes' if self.config.download_subtitles else 'No'}",
-            f"Subtitle Language: {self.config.subtitle_language}",
-            f"Max Concurrent Downloads: {self.config.max_concurrent_downloads}",
-            f"Browser Headless Mode: {'Yes' if self.config.headless_browser else 'No'}",
-            f"Max Retry Attempts: {self.config.max_retries}",
-            f"SSL Verification: {'Yes' if self.config.verify_ssl else 'No'}",
-            "Save and Exit"
-        ]
+        config_options = [self._format_option(i) for i in range(len(self._CONFIG_FIELDS))]
+        config_options.append("Save and Exit")
+        
+        cyan, green = self.ui.Fore.LIGHTCYAN_EX, self.ui.Fore.LIGHTGREEN_EX
+        # Numbered, coloured prefixes never change, so build them once
+        prefixes = [f"{self.ui.Fore.LIGHTYELLOW_EX}  {i}. " for i in range(1, len(config_options) + 1)]
         
         while True:
-            print(f"\n{self.ui.Fore.LIGHTCYAN_EX}Current Configuration:")
-            for i, option in enumerate(config_options, 1):
-                print(f"{self.ui.Fore.LIGHTYELLOW_EX}  {i}. {option}")
+            write_lines(
+                f"\n{cyan}Current Configuration:",
+                *map(str.__add__, prefixes, config_options),
+            )
             
             try:
-                choice = input(f"\n{self.ui.Fore.LIGHTGREEN_EX}Select option to change (1-{len(config_options)}): ")
+                choice = input(f"\n{green}Select option to change (1-{len(config_options)}): ")
                 choice_idx = int(choice) - 1
                 
                 if choice_idx == len(config_options) - 1:  # Save and Exit
@@ -100,18 +132,8 @@ Examples:
                     break
                 elif 0 <= choice_idx < len(config_options) - 1:
                     self._handle_config_change(choice_idx)
-                    # Update the options display
-                    config_options = [
-                        f"Output Directory: {self.config.output_directory}",
-                        f"Default Quality: {self.config.default_quality}",
-                        f"Download Subtitles: {'Yes' if self.config.download_subtitles else 'No'}",
-                        f"Subtitle Language: {self.config.subtitle_language}",
-                        f"Max Concurrent Downloads: {self.config.max_concurrent_downloads}",
-                        f"Browser Headless Mode: {'Yes' if self.config.headless_browser else 'No'}",
-                        f"Max Retry Attempts: {self.config.max_retries}",
-                        f"SSL Verification: {'Yes' if self.config.verify_ssl else 'No'}",
-                        "Save and Exit"
-                    ]
+                    # Only the changed option needs re-rendering
+                    config_options[choice_idx] = self._format_option(choice_idx)
                 else:
                     self.ui.print_error(f"Please enter a number between 1 and {len(config_options)}")
             
@@ -121,59 +143,21 @@ Examples:
                 print(f"\n{self.ui.Fore.LIGHTRED_EX}Configuration cancelled")
                 break
     
+    def _format_option(self, option_idx: int) -> str:
+        """Render a single configuration menu entry from the current config"""
+        label, field, _, _ = self._CONFIG_FIELDS[option_idx]
+        value = getattr(self.config, field)
+        if isinstance(value, bool):
+            value = 'Yes' if value else 'No'
+        return f"{label}: {value}"
+    
     def _handle_config_change(self, option_idx: int):
         """Handle configuration option changes"""
+        _, field, prompt, read_value = self._CONFIG_FIELDS[option_idx]
         try:
-            if option_idx == 0:  # Output Directory
-                new_dir = input(f"Enter new output directory [{self.config.output_directory}]: ").strip()
-                if new_dir:
-                    self.config.output_directory = new_dir
-            
-            elif option_idx == 1:  # Default Quality
-                qualities = ["best", "worst", "720p", "1080p"]
-                quality = self.ui.get_user_choice("Select default quality:", qualities)
-                self.config.default_quality = quality
-            
-            elif option_idx == 2:  # Download Subtitles
-                self.config.download_subtitles = self.ui.confirm_action(
-                    "Download subtitles by default?", self.config.download_subtitles
-                )
-            
-            elif option_idx == 3:  # Subtitle Language
-                new_lang = input(f"Enter subtitle language code [{self.config.subtitle_language}]: ").strip()
-                if new_lang:
-                    self.config.subtitle_language = new_lang
-            
-            elif option_idx == 4:  # Max Concurrent Downloads
-                try:
-                    new_max = int(input(f"Enter max concurrent downloads [{self.config.max_concurrent_downloads}]: "))
-                    if 1 <= new_max <= 10:
-                        self.config.max_concurrent_downloads = new_max
-                    else:
-                        self.ui.print_error("Please enter a number between 1 and 10")
-                except ValueError:
-                    self.ui.print_error("Please enter a valid number")
-            
-            elif option_idx == 5:  # Browser Headless Mode
-                self.config.headless_browser = self.ui.confirm_action(
-                    "Run browser in headless mode?", self.config.headless_browser
-                )
-            
-            elif option_idx == 6:  # Max Retry Attempts
-                try:
-                    new_retries = int(input(f"Enter max retry attempts [{self.config.max_retries}]: "))
-                    if 1 <= new_retries <= 20:
-                        self.config.max_retries = new_retries
-                    else:
-                        self.ui.print_error("Please enter a number between 1 and 20")
-                except ValueError:
-                    self.ui.print_error("Please enter a valid number")
-            
-            elif option_idx == 7:  # SSL Verification
-                self.config.verify_ssl = self.ui.confirm_action(
-                    "Enable SSL verification?", self.config.verify_ssl
-                )
-            
+            value = read_value(prompt, getattr(self.config, field))
+            if value is not None:
+                setattr(self.config, field, value)
         except KeyboardInterrupt:
             self.ui.print_info("Configuration change cancelled")
     
@@ -224,6 +208,8 @@ Examples:
             self.config.output_directory = args.output
         if args.max_retries:
             self.config.max_retries = args.max_retries
+        if args.quality:
+            self.config.default_quality = args.quality
         if args.no_subs:
             self.config.download_subtitles = False
         if args.sub_lang:
@@ -246,35 +232,39 @@ Examples:
         self.ui.print_section_header("Batch Download Mode")
         
         try:
+            # Count entries up front, then stream the names instead of holding the whole list
             with open(batch_file, 'r', encoding='utf-8') as f:
-                anime_list = [line.strip() for line in f.readlines() if line.strip()]
+                total = sum(1 for _ in filter(None, map(str.strip, f)))
             
-            if not anime_list:
+            if not total:
                 self.ui.print_error("Batch file is empty")
                 return False
             
-            self.ui.print_info(f"Found {len(anime_list)} anime in batch file")
+            self.ui.print_info(f"Found {total} anime in batch file")
             
             successful = 0
             failed = 0
             
-            for i, anime_name in enumerate(anime_list, 1):
-                print(f"\n{self.ui.Fore.LIGHTCYAN_EX}Processing {i}/{len(anime_list)}: {anime_name}")
-                
-                try:
-                    if self._download_anime(anime_name=anime_name):
-                        successful += 1
-                    else:
+            with open(batch_file, 'r', encoding='utf-8') as f:
+                for i, anime_name in enumerate(filter(None, map(str.strip, f)), 1):
+                    print(f"\n{self.ui.Fore.LIGHTCYAN_EX}Processing {i}/{total}: {anime_name}")
+                    
+                    try:
+                        if self._download_anime(anime_name=anime_name):
+                            successful += 1
+                        else:
+                            failed += 1
+                    except Exception as e:
+                        self.ui.print_error(f"Failed to download {anime_name}: {e}")
                         failed += 1
-                except Exception as e:
-                    self.ui.print_error(f"Failed to download {anime_name}: {e}")
-                    failed += 1
             
             # Summary
             self.ui.print_section_header("Batch Download Summary")
-            print(f"{self.ui.Fore.LIGHTGREEN_EX}✅ Successful: {successful}")
-            print(f"{self.ui.Fore.LIGHTRED_EX}❌ Failed: {failed}")
-            print(f"{self.ui.Fore.LIGHTCYAN_EX}📊 Total: {len(anime_list)}")
+            write_lines(
+                f"{self.ui.Fore.LIGHTGREEN_EX}✅ Successful: {successful}",
+                f"{self.ui.Fore.LIGHTRED_EX}❌ Failed: {failed}",
+                f"{self.ui.Fore.LIGHTCYAN_EX}📊 Total: {total}",
+            )
             
             return successful > 0
             
@@ -295,7 +285,7 @@ class EnhancedHianimeExtractor(HianimeExtractor):
         self.config = config or DownloadConfig()
         self.progress = progress or ProgressTracker()
         self.network_indicator = network_indicator or NetworkStatusIndicator()
-        self.ui = UserInterface()
+        self.ui = get_ui()
     
     def make_request_with_retry(self, url: str, max_retries: int = None, timeout: int = None, delay: float = None):
         """Enhanced request method with better user feedback"""
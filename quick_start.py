@@ -6,32 +6,48 @@ Automatically sets up the environment and runs the enhanced version
 
 import os
 import sys
+import hashlib
+import importlib
+import runpy
+import shutil
 import subprocess
 import platform
 from pathlib import Path
 
 def check_python_version():
     """Check if Python version is compatible"""
-    if sys.version_info < (3, 8):
-        print("❌ Python 3.8 or higher is required!")
+    if sys.version_info < (3, 10):
+        print("❌ Python 3.10 or higher is required!")
         print(f"Current version: {sys.version}")
         return False
     print(f"✅ Python {sys.version_info.major}.{sys.version_info.minor} detected")
     return True
 
 def install_dependencies():
-    """Install required dependencies"""
+    """Install required dependencies, skipping pip if nothing changed since the last install"""
+    # Key on the interpreter too, so switching venv or Python version reinstalls
+    digest = hashlib.sha256(Path("requirements.txt").read_bytes())
+    digest.update(f"{sys.executable}\n{sys.version}".encode("utf-8"))
+    requirements_hash = digest.hexdigest()
+    marker = Path(".deps.sha256")
+    if marker.exists() and marker.read_text() == requirements_hash:
+        print("✅ Dependencies already installed")
+        return True
+    
     print("📦 Installing dependencies...")
     try:
         subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        marker.write_text(requirements_hash)
         print("✅ Dependencies installed successfully!")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ Failed to install dependencies: {e}")
         return False
 
-def check_chrome():
-    """Check if Chrome is installed"""
+CHROME_MARKER = Path(".chrome_path")
+
+def find_chrome():
+    """Locate the Chrome executable, returning its path or None"""
     system = platform.system().lower()
     
     if system == "windows":
@@ -46,40 +62,81 @@ def check_chrome():
     
     for path in chrome_paths:
         if os.path.exists(path):
-            print("✅ Google Chrome detected")
-            return True
+            return path
+    
+    # Installed somewhere unusual: fall back to a PATH lookup
+    if system not in ("windows", "darwin"):
+        for name in ("google-chrome", "google-chrome-stable", "chromium-browser", "chromium"):
+            path = shutil.which(name)
+            if path:
+                return path
+    return None
+
+def check_chrome():
+    """Check if Chrome is installed, remembering its location in .chrome_path"""
+    # Fast path: reuse the location found on a previous launch
+    try:
+        cached_path = CHROME_MARKER.read_text().strip()
+    except OSError:
+        cached_path = ""
+    if cached_path and os.path.exists(cached_path):
+        print("✅ Google Chrome detected")
+        return True
+    
+    chrome_path = find_chrome()
+    if chrome_path:
+        try:
+            CHROME_MARKER.write_text(chrome_path)
+        except OSError:
+            pass  # Caching is best effort
+        print("✅ Google Chrome detected")
+        return True
     
     print("⚠️  Google Chrome not found. Please install Chrome for full functionality.")
     return False
 
 def create_default_config():
     """Create default configuration if it doesn't exist"""
-    config_file = Path("config.json")
-    if not config_file.exists():
-        print("🔧 Creating default configuration...")
-        
-        # Import and create config
-        try:
-            from tools.config_manager import ConfigManager
-            config_manager = ConfigManager()
-            print("✅ Default configuration created")
-            return True
-        except ImportError:
-            print("⚠️  Could not create default config, will be created on first run")
-            return True
-    
-    print("✅ Configuration file exists")
-    return True
+    # Common case: nothing to do, and no need to import the config module
+    if os.path.isfile("config.json"):
+        print("✅ Configuration file exists")
+        return True
+    
+    print("🔧 Creating default configuration...")
+    
+    # Import and create config
+    try:
+        from tools.config_manager import get_config_manager
+        get_config_manager()
+        print("✅ Default configuration created")
+        return True
+    except ImportError:
+        print("⚠️  Could not create default config, will be created on first run")
+        return True
 
 def setup_directories():
     """Set up necessary directories"""
     directories = ["downloads", "logs", "temp"]
     
     for directory in directories:
-        Path(directory).mkdir(exist_ok=True)
+        # Plain mkdir is a single syscall; an existing directory is the common case
+        try:
+            os.mkdir(directory)
+        except FileExistsError:
+            pass
     
     print("✅ Directories set up")
 
+def run_script(script):
+    """Run an app script in this interpreter, falling back to a child process"""
+    sys.argv = [script] + sys.argv[1:]
+    try:
+        # Freshly pip-installed packages must be visible to the import system
+        importlib.invalidate_caches()
+        runpy.run_path(script, run_name="__main__")
+    except ImportError:
+        subprocess.run([sys.executable] + sys.argv)
+
 def run_enhanced_app():
     """Run the enhanced application"""
     print("\n🚀 Starting Enhanced HiAnime Downloader...")
@@ -88,10 +145,10 @@ def run_enhanced_app():
     try:
         # Try to import and run the enhanced app
         if os.path.exists("main_enhanced.py"):
-            subprocess.run([sys.executable, "main_enhanced.py"] + sys.argv[1:])
+            run_script("main_enhanced.py")
         else:
             print("❌ Enhanced main file not found, falling back to original...")
-            subprocess.run([sys.executable, "main.py"] + sys.argv[1:])
+            run_script("main.py")
     except KeyboardInterrupt:
         print("\n👋 Thank you for using HiAnime Downloader!")
     except Exception as e:
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 
 import requests
-import time
+from urllib3.util.retry import Retry
+from requests.adapters import HTTPAdapter
 
 def test_connection():
     headers = {
@@ -12,39 +13,43 @@ def test_connection():
         "Accept-Language": "en-US,en;q=0.8",
         "Connection": "keep-alive",
     }
-    
+
     url = "https://hianime.nz"
-    
-    for attempt in range(3):
-        try:
-            print(f"Attempt {attempt + 1}: Testing connection to {url}")
-            response = requests.get(
-                url, 
-                headers=headers, 
-                timeout=10,
-                verify=True
-            )
-            response.raise_for_status()
-            print(f"Success! Status: {response.status_code}")
-            print(f"Content length: {len(response.content)}")
-            return response
-            
-        except requests.exceptions.ConnectionError as e:
-            print(f"Connection error: {e}")
-        except requests.exceptions.Timeout as e:
-            print(f"Timeout error: {e}")
-        except requests.exceptions.SSLError as e:
-            print(f"SSL error: {e}")
-        except Exception as e:
-            print(f"Other error: {e}")
-            
-        if attempt < 2:
-            wait_time = 5
-            print(f"Waiting {wait_time} seconds before retry...")
-            time.sleep(wait_time)
-    
+
+    session = requests.Session()
+    session.headers.update(headers)
+
+    # Let urllib3 retry on the pooled keep-alive connection instead of reconnecting per attempt
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=retry_strategy)
+    session.mount("https://", adapter)
+
+    try:
+        print(f"Testing connection to {url}")
+        response = session.get(url, timeout=10, verify=True)
+        response.raise_for_status()
+        print(f"Success! Status: {response.status_code}")
+        print(f"Content length: {len(response.content)}")
+        return response
+
+    except requests.exceptions.SSLError as e:
+        print(f"SSL error: {e}")
+    except requests.exceptions.ConnectionError as e:
+        print(f"Connection error: {e}")
+    except requests.exceptions.Timeout as e:
+        print(f"Timeout error: {e}")
+    except Exception as e:
+        print(f"Other error: {e}")
+    finally:
+        session.close()
+
     print("All attempts failed!")
     return None
 
 if __name__ == "__main__":
-    test_connection()
\ No newline at end of file
+    test_connection()
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+import os
+import tempfile
+
+from tools.download_manager import SmartDownloadManager
+
+def test_resume_roundtrip():
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "episode.mp4")
+        with open(filename, "wb") as f:
+            f.write(b"x" * 1024)
+
+        manager = SmartDownloadManager()
+        manager.resume_data_file = os.path.join(tmp, "download_resume.json")
+        task = manager.add_download(
+            "http://example.com/episode.mp4",
+            filename,
+            {"User-Agent": "test", "Referer": "http://example.com"},
+            1,
+            "Episode 1",
+        )
+        task.status = "paused"
+        manager.save_resume_data()
+
+        resumed = SmartDownloadManager()
+        resumed.resume_data_file = manager.resume_data_file
+        assert resumed.load_resume_data()
+
+        loaded = resumed.download_tasks[0]
+        assert loaded.filename == filename
+        assert loaded.downloaded == 1024
+        assert dict(loaded.headers) == {"User-Agent": "test", "Referer": "http://example.com"}
+        print("Resume data saved and reloaded")
+
+if __name__ == "__main__":
+    test_resume_roundtrip()
@@ -4,12 +4,22 @@ Configuration management for HiAnime Downloader
 Provides easy customization and settings management
 """
 
-import json
+import functools
 import os
-from dataclasses import dataclass, asdict
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, asdict, fields
+from typing import Dict, Any, Optional, Sequence
 
-@dataclass
+from tools.functions import load_json_file, save_json_file
+
+# Shared by every config that doesn't override it, so no per-instance list is built
+DEFAULT_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+)
+
+@dataclass(slots=True)
 class DownloadConfig:
     """Configuration settings for the downloader"""
     # Network settings
@@ -36,34 +46,36 @@ class DownloadConfig:
     
     # User agent rotation
     rotate_user_agents: bool = True
-    user_agents: list = None
+    user_agents: Optional[Sequence[str]] = None
     
     def __post_init__(self):
         if self.user_agents is None:
-            self.user_agents = [
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            ]
+            self.user_agents = DEFAULT_USER_AGENTS
+        else:
+            # JSON gives back a list; keep it immutable like the default
+            self.user_agents = tuple(self.user_agents)
 
 class ConfigManager:
     """Manages configuration loading and saving"""
     
     def __init__(self, config_path: str = "config.json"):
         self.config_path = config_path
-        self.config = self.load_config()
+        self._cached_config: Optional[DownloadConfig] = None
+        self._cached_mtime: Optional[int] = None
+        self.config = self.get_config()
     
     def load_config(self) -> DownloadConfig:
         """Load configuration from file or create default"""
-        if os.path.exists(self.config_path):
-            try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    config_dict = json.load(f)
-                return DownloadConfig(**config_dict)
-            except Exception as e:
-                print(f"Error loading config: {e}")
-                print("Using default configuration...")
+        try:
+            config_dict = load_json_file(self.config_path)
+            # Ignore keys from other versions instead of resetting the file
+            known = {field.name for field in fields(DownloadConfig)}
+            return DownloadConfig(**{k: v for k, v in config_dict.items() if k in known})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading config: {e}")
+            print("Using default configuration...")
         
         # Create default config
         config = DownloadConfig()
@@ -73,18 +85,44 @@ class ConfigManager:
     def save_config(self, config: DownloadConfig) -> None:
         """Save configuration to file"""
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(asdict(config), f, indent=4)
+            save_json_file(self.config_path, asdict(config))
         except Exception as e:
             print(f"Error saving config: {e}")
+            return
+        
+        # Our own write shouldn't force a re-parse on the next get_config()
+        self._cached_config = config
+        self._cached_mtime = self._get_mtime()
+    
+    def _get_mtime(self) -> Optional[int]:
+        """Return the config file's modification time in ns, or None if missing"""
+        try:
+            return os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return None
     
     def get_config(self) -> DownloadConfig:
-        """Get current configuration"""
-        return self.config
+        """Get current configuration, re-reading the file only if it changed on disk"""
+        mtime = self._get_mtime()
+        if self._cached_config is None or mtime is None or mtime != self._cached_mtime:
+            # Record the stat we just took; save_config() overwrites it if a default gets written
+            self._cached_mtime = mtime
+            self._cached_config = self.load_config()
+            self.config = self._cached_config
+        return self._cached_config
     
     def update_config(self, **kwargs) -> None:
         """Update configuration with new values"""
         for key, value in kwargs.items():
             if hasattr(self.config, key):
                 setattr(self.config, key, value)
-        self.save_config(self.config)
\ No newline at end of file
+        self.save_config(self.config)
+
+def get_config_manager(config_path: str = "config.json") -> ConfigManager:
+    """Get the shared ConfigManager for a config file"""
+    # Normalise first so every spelling of the same file shares one manager
+    return _get_config_manager(os.path.abspath(config_path))
+
+@functools.cache
+def _get_config_manager(config_path: str) -> ConfigManager:
+    return ConfigManager(config_path)
@@ -4,24 +4,32 @@ Smart Download Manager with parallel processing and resume capabilities
 """
 
 import os
-import json
 import time
 import asyncio
 import aiohttp
-import aiofiles
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Any, Optional, Callable
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Optional, Callable, Mapping, Tuple
+from dataclasses import dataclass, fields
 from pathlib import Path
 import hashlib
 from colorama import Fore
+from multidict import CIMultiDict
 
-@dataclass
+from tools.functions import decode_json, encode_json, load_json_file, save_json_file
+
+# zstandard is optional; without it resume data is written as plain JSON
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+@dataclass(slots=True)
 class DownloadTask:
     """Represents a download task"""
     url: str
     filename: str
-    headers: Dict[str, str]
+    headers: Mapping[str, str]  # CIMultiDict once added to a manager
     episode_number: int
     episode_title: str
     file_size: int = 0
@@ -30,27 +38,45 @@ class DownloadTask:
     retry_count: int = 0
     max_retries: int = 3
 
+def _task_to_dict(task: DownloadTask) -> Dict[str, Any]:
+    """Serialise a task without dataclasses.asdict's recursive deepcopy"""
+    data = {field.name: getattr(task, field.name) for field in fields(task)}
+    # CIMultiDict keys are istr, which orjson rejects as dict keys
+    data["headers"] = {str(k): v for k, v in task.headers.items()}
+    return data
+
 class SmartDownloadManager:
     """Enhanced download manager with smart features"""
     
-    def __init__(self, max_concurrent: int = 3, chunk_size: int = 1024*1024):
+    def __init__(self, max_concurrent: int = 3, chunk_size: int = 4*1024*1024):
         self.max_concurrent = max_concurrent
         self.chunk_size = chunk_size
         self.download_tasks: List[DownloadTask] = []
         self.progress_callbacks: List[Callable] = []
+        self.progress_interval = 0.25  # seconds between progress callbacks per download
         self.resume_data_file = "download_resume.json"
+        self._known_dirs: set[str] = set()
+        self._headers_cache: Dict[frozenset, CIMultiDict] = {}
         
     def add_progress_callback(self, callback: Callable):
         """Add a progress callback function"""
         self.progress_callbacks.append(callback)
     
+    def _intern_headers(self, headers: Mapping[str, str]) -> CIMultiDict:
+        """Return a shared CIMultiDict for identical header sets (episodes of one anime share them)"""
+        key = frozenset(headers.items())
+        shared = self._headers_cache.get(key)
+        if shared is None:
+            shared = self._headers_cache[key] = CIMultiDict(headers)
+        return shared
+    
     def add_download(self, url: str, filename: str, headers: Dict[str, str], 
                     episode_number: int, episode_title: str) -> DownloadTask:
         """Add a download task"""
         task = DownloadTask(
             url=url,
             filename=filename,
-            headers=headers,
+            headers=self._intern_headers(headers),
             episode_number=episode_number,
             episode_title=episode_title
         )
@@ -60,41 +86,57 @@ class SmartDownloadManager:
     def save_resume_data(self):
         """Save download progress for resume capability"""
         resume_data = {
-            "tasks": [asdict(task) for task in self.download_tasks if task.status in ["downloading", "paused"]]
+            "tasks": [_task_to_dict(task) for task in self.download_tasks if task.status in ["downloading", "paused"]]
         }
         
         try:
-            with open(self.resume_data_file, 'w') as f:
-                json.dump(resume_data, f, indent=2)
+            if zstandard:
+                # Headers repeat across tasks, so even the fastest level shrinks this a lot
+                data = zstandard.ZstdCompressor(level=1).compress(encode_json(resume_data))
+                with open(f"{self.resume_data_file}.zst", 'wb') as f:
+                    f.write(data)
+            else:
+                save_json_file(self.resume_data_file, resume_data)
         except Exception as e:
             print(f"{Fore.LIGHTRED_EX}Failed to save resume data: {e}")
     
+    def _read_resume_data(self) -> Dict[str, Any]:
+        """Read resume data, preferring the compressed file"""
+        if zstandard:
+            try:
+                with open(f"{self.resume_data_file}.zst", 'rb') as f:
+                    return decode_json(zstandard.ZstdDecompressor().decompress(f.read()))
+            except FileNotFoundError:
+                pass  # Fall back to an uncompressed file
+        return load_json_file(self.resume_data_file)
+    
     def load_resume_data(self) -> bool:
         """Load previous download progress"""
-        if not os.path.exists(self.resume_data_file):
-            return False
-        
         try:
-            with open(self.resume_data_file, 'r') as f:
-                resume_data = json.load(f)
+            resume_data = self._read_resume_data()
             
             resumed_count = 0
             for task_data in resume_data.get("tasks", []):
                 # Check if file exists and has partial content
                 filename = task_data["filename"]
-                if os.path.exists(filename):
-                    file_size = os.path.getsize(filename)
-                    if file_size > 0:
-                        task = DownloadTask(**task_data)
-                        task.downloaded = file_size
-                        task.status = "paused"
-                        self.download_tasks.append(task)
-                        resumed_count += 1
+                try:
+                    file_size = os.stat(filename).st_size
+                except FileNotFoundError:
+                    continue
+                if file_size > 0:
+                    task = DownloadTask(**task_data)
+                    task.headers = self._intern_headers(task.headers)
+                    task.downloaded = file_size
+                    task.status = "paused"
+                    self.download_tasks.append(task)
+                    resumed_count += 1
             
             if resumed_count > 0:
                 print(f"{Fore.LIGHTGREEN_EX}📂 Resumed {resumed_count} partial downloads")
                 return True
             
+        except FileNotFoundError:
+            return False
         except Exception as e:
             print(f"{Fore.LIGHTRED_EX}Failed to load resume data: {e}")
         
@@ -103,13 +145,13 @@ class SmartDownloadManager:
     async def download_with_progress(self, task: DownloadTask, session: aiohttp.ClientSession):
         """Download a file with progress tracking and resume support"""
         try:
-            headers = task.headers.copy()
-            
-            # Check if we can resume
+            # Check if we can resume; only then do we need headers beyond the task's own
             if task.downloaded > 0 and os.path.exists(task.filename):
+                headers = CIMultiDict(task.headers)
                 headers['Range'] = f'bytes={task.downloaded}-'
                 mode = 'ab'  # Append binary
             else:
+                headers = task.headers
                 task.downloaded = 0
                 mode = 'wb'  # Write binary
             
@@ -129,20 +171,33 @@ class SmartDownloadManager:
                         else:
                             task.file_size = int(content_length)
                 
-                # Create directory if it doesn't exist
-                os.makedirs(os.path.dirname(task.filename), exist_ok=True)
+                # Create directory if it doesn't exist (episodes usually share one season folder)
+                directory = os.path.dirname(task.filename)
+                if directory and directory not in self._known_dirs:
+                    os.makedirs(directory, exist_ok=True)
+                    self._known_dirs.add(directory)
                 
-                # Download with progress
-                async with aiofiles.open(task.filename, mode) as f:
-                    async for chunk in response.content.iter_chunked(self.chunk_size):
-                        await f.write(chunk)
+                # Download with progress; a local write to the page cache is too quick
+                # to be worth a thread-pool hop per chunk
+                with open(task.filename, mode) as f:
+                    last_callback = 0.0
+                    
+                    # Take whatever the socket has buffered rather than fixed-size slices
+                    while chunk := await response.content.readany():
+                        f.write(chunk)
                         task.downloaded += len(chunk)
                         
-                        # Call progress callbacks
-                        for callback in self.progress_callbacks:
-                            callback(task)
+                        # Call progress callbacks, at most once per interval
+                        now = time.monotonic()
+                        if now - last_callback > self.progress_interval:
+                            last_callback = now
+                            for callback in self.progress_callbacks:
+                                callback(task)
             
             task.status = "completed"
+            # Progress callbacks keep snapshots, so report the final state too
+            for callback in self.progress_callbacks:
+                callback(task)
             print(f"{Fore.LIGHTGREEN_EX}✅ Completed: Episode {task.episode_number}")
             
         except asyncio.CancelledError:
@@ -170,81 +225,92 @@ class SmartDownloadManager:
         timeout = aiohttp.ClientTimeout(total=None, connect=30)
         connector = aiohttp.TCPConnector(limit=self.max_concurrent, limit_per_host=self.max_concurrent)
         
-        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
-            # Create semaphore to limit concurrent downloads
-            semaphore = asyncio.Semaphore(self.max_concurrent)
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector,
+                                         read_bufsize=self.chunk_size) as session:
+            # Bounded worker pool: only max_concurrent coroutines exist regardless of queue length
+            queue: asyncio.Queue = asyncio.Queue()
+            for task in self.download_tasks:
+                if task.status in ["pending", "paused"]:
+                    queue.put_nowait(task)
             
-            async def download_with_semaphore(task):
-                async with semaphore:
-                    return await self.download_with_progress(task, session)
+            async def worker():
+                while True:
+                    task = await queue.get()
+                    try:
+                        await self.download_with_progress(task, session)
+                        
+                        # Failed downloads that can be retried come back as pending
+                        if task.status == "pending" and task.retry_count < task.max_retries:
+                            await asyncio.sleep(2)  # Brief pause before retry
+                            queue.put_nowait(task)
+                    finally:
+                        queue.task_done()
             
-            # Start all downloads
-            pending_tasks = [task for task in self.download_tasks if task.status in ["pending", "paused"]]
+            workers = [asyncio.create_task(worker()) for _ in range(min(self.max_concurrent, queue.qsize()))]
             
-            while pending_tasks:
-                # Create async tasks for pending downloads
-                async_tasks = [download_with_semaphore(task) for task in pending_tasks]
+            try:
+                await queue.join()
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                print(f"\n{Fore.LIGHTYELLOW_EX}⏸️ Pausing downloads...")
+                raise
+            finally:
+                for worker_task in workers:
+                    worker_task.cancel()
                 
-                try:
-                    # Wait for all downloads to complete
-                    await asyncio.gather(*async_tasks, return_exceptions=True)
-                except KeyboardInterrupt:
-                    print(f"\n{Fore.LIGHTYELLOW_EX}⏸️ Pausing downloads...")
-                    for async_task in async_tasks:
-                        async_task.cancel()
-                    
-                    # Wait for cancellation to complete
-                    await asyncio.gather(*async_tasks, return_exceptions=True)
-                    self.save_resume_data()
-                    raise
-                
-                # Check for failed tasks that can be retried
-                pending_tasks = [task for task in self.download_tasks 
-                               if task.status == "pending" and task.retry_count < task.max_retries]
-                
-                if pending_tasks:
-                    print(f"{Fore.LIGHTYELLOW_EX}🔄 Retrying {len(pending_tasks)} failed downloads...")
-                    await asyncio.sleep(2)  # Brief pause before retry
+                # Wait for cancellation to complete; interrupted downloads save their own resume data
+                await asyncio.gather(*workers, return_exceptions=True)
     
     def get_download_summary(self) -> Dict[str, int]:
         """Get download statistics"""
-        summary = {
+        counts = Counter(task.status for task in self.download_tasks)
+        return {
             "total": len(self.download_tasks),
-            "completed": 0,
-            "failed": 0,
-            "pending": 0,
-            "downloading": 0
+            "completed": counts["completed"],
+            "failed": counts["failed"],
+            "pending": counts["pending"],
+            "downloading": counts["downloading"]
         }
-        
-        for task in self.download_tasks:
-            if task.status in summary:
-                summary[task.status] += 1
-        
-        return summary
     
     def cleanup_resume_data(self):
         """Clean up resume data after successful completion"""
-        try:
-            if os.path.exists(self.resume_data_file):
-                os.remove(self.resume_data_file)
-        except Exception:
-            pass  # Ignore cleanup errors
+        for path in (self.resume_data_file, f"{self.resume_data_file}.zst"):
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except Exception:
+                pass  # Ignore cleanup errors
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB")
+_SPEED_UNITS = ("B/s", "KB/s", "MB/s")
+
+def _unit_index(value: float, max_unit: int) -> int:
+    """Index of the largest 1024-power unit not exceeding value, from its bit length"""
+    return min(max(int(value).bit_length() - 1, 0) // 10, max_unit)
 
 class AdvancedProgressTracker:
     """Advanced progress tracker for multiple downloads"""
     
     def __init__(self):
-        self.tasks: Dict[str, DownloadTask] = {}
+        # Last reported (downloaded, file_size, status) per filename, plus running totals
+        # updated by delta so a redraw never has to walk every task
+        self._prev: Dict[str, Tuple[int, int, str]] = {}
+        self._total_downloaded = 0
+        self._total_size = 0
+        self._completed = 0
         self.start_time = time.time()
         self.last_update = 0
         
     def update_task_progress(self, task: DownloadTask):
         """Update progress for a specific task"""
-        self.tasks[task.filename] = task
+        prev_downloaded, prev_size, prev_status = self._prev.get(task.filename, (0, 0, ""))
+        self._total_downloaded += task.downloaded - prev_downloaded
+        self._total_size += task.file_size - prev_size
+        self._completed += (task.status == "completed") - (prev_status == "completed")
+        self._prev[task.filename] = (task.downloaded, task.file_size, task.status)
         
-        # Throttle updates to avoid spam
+        # Throttle updates to avoid spam, but always draw a completion so 100% is shown
         current_time = time.time()
-        if current_time - self.last_update < 0.5:  # Update max every 0.5 seconds
+        if task.status != "completed" and current_time - self.last_update < 0.5:  # Update max every 0.5 seconds
             return
         
         self.last_update = current_time
@@ -252,12 +318,12 @@ class AdvancedProgressTracker:
     
     def _display_progress(self):
         """Display current progress"""
-        if not self.tasks:
+        if not self._prev:
             return
         
         # Calculate overall progress
-        total_size = sum(task.file_size for task in self.tasks.values())
-        total_downloaded = sum(task.downloaded for task in self.tasks.values())
+        total_size = self._total_size
+        total_downloaded = self._total_downloaded
         
         if total_size > 0:
             overall_progress = (total_downloaded / total_size) * 100
@@ -273,8 +339,8 @@ class AdvancedProgressTracker:
             speed_str = "Calculating..."
         
         # Count statuses
-        completed = sum(1 for task in self.tasks.values() if task.status == "completed")
-        total = len(self.tasks)
+        completed = self._completed
+        total = len(self._prev)
         
         # Clear line and display progress
         print(f"\r{Fore.LIGHTGREEN_EX}📊 Progress: {overall_progress:.1f}% "
@@ -285,23 +351,15 @@ class AdvancedProgressTracker:
     
     def _format_size(self, size_bytes: int) -> str:
         """Format file size in human readable format"""
-        if size_bytes < 1024:
+        unit = _unit_index(size_bytes, len(_SIZE_UNITS) - 1)
+        if unit == 0:
             return f"{size_bytes} B"
-        elif size_bytes < 1024*1024:
-            return f"{size_bytes/1024:.1f} KB"
-        elif size_bytes < 1024*1024*1024:
-            return f"{size_bytes/(1024*1024):.1f} MB"
-        else:
-            return f"{size_bytes/(1024*1024*1024):.1f} GB"
+        return f"{size_bytes / (1 << (10 * unit)):.1f} {_SIZE_UNITS[unit]}"
     
     def _format_speed(self, speed: float) -> str:
         """Format download speed"""
-        if speed < 1024:
-            return f"{speed:.1f} B/s"
-        elif speed < 1024*1024:
-            return f"{speed/1024:.1f} KB/s"
-        else:
-            return f"{speed/(1024*1024):.1f} MB/s"
+        unit = _unit_index(speed, len(_SPEED_UNITS) - 1)
+        return f"{speed / (1 << (10 * unit)):.1f} {_SPEED_UNITS[unit]}"
     
     def finish(self):
         """Finish progress tracking"""
@@ -310,9 +368,16 @@ class AdvancedProgressTracker:
 # Example usage function for integration
 def create_smart_downloader(config) -> SmartDownloadManager:
     """Create a configured smart download manager"""
+    # uvloop is optional (not available on Windows); it speeds up aiohttp's socket-heavy loop
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     manager = SmartDownloadManager(
         max_concurrent=config.max_concurrent_downloads,
-        chunk_size=1024*1024  # 1MB chunks
+        chunk_size=4*1024*1024  # 4MB read buffer
     )
     
     # Set up progress tracking
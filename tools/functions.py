@@ -1,5 +1,44 @@
+import json
 import os
+import sys
 import time
+from typing import Any
+
+# orjson is optional; it serialises several times faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def clear_screen() -> None:
+    # ANSI clear + cursor home; colorama translates this on legacy Windows consoles
+    if sys.stdout.isatty():
+        sys.stdout.write("\x1b[H\x1b[2J")
+        sys.stdout.flush()
+
+
+def encode_json(obj: Any) -> bytes:
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def decode_json(data: bytes) -> Any:
+    # json.loads detects the UTF encoding from the bytes
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def load_json_file(path: str) -> Any:
+    # One bulk binary read, parsed in one go
+    with open(path, "rb") as f:
+        return decode_json(f.read())
+
+
+def save_json_file(path: str, obj: Any) -> None:
+    data = encode_json(obj)
+    with open(path, "wb") as f:
+        f.write(data)
 
 
 def get_conformation(prompt: str) -> bool:
@@ -3,6 +3,7 @@
 Progress tracking and user interface improvements for HiAnime Downloader
 """
 
+import functools
 import sys
 import time
 from typing import Optional, List, Dict, Any
@@ -10,12 +11,24 @@ from colorama import Fore, Style, init
 from threading import Lock
 import os
 
-# Initialize colorama
+# Initialize colorama; autoreset keeps plain print/input calls elsewhere from leaking colour
 init(autoreset=True)
 
+
+def write_lines(*lines: str):
+    """Write coloured lines to stdout in a single call, resetting style after each"""
+    sys.stdout.write("".join(f"{line}{Style.RESET_ALL}\n" for line in lines))
+    sys.stdout.flush()
+
+
 class ProgressTracker:
     """Enhanced progress tracking with better visual feedback"""
     
+    _CLEAR_LINE = '\r' + ' ' * 100 + '\r'
+    _BAR_LENGTH = 30
+    _BAR_FULL = '█' * _BAR_LENGTH
+    _BAR_EMPTY = '░' * _BAR_LENGTH
+    
     def __init__(self):
         self.lock = Lock()
         self.current_task = ""
@@ -63,16 +76,14 @@ class ProgressTracker:
                 eta_str = "Calculating..."
             
             # Create progress bar
-            bar_length = 30
-            filled_length = int(bar_length * progress // 100)
-            bar = '█' * filled_length + '░' * (bar_length - filled_length)
+            filled_length = int(self._BAR_LENGTH * progress // 100)
+            bar = self._BAR_FULL[:filled_length] + self._BAR_EMPTY[filled_length:]
             
-            # Clear line and print progress
-            sys.stdout.write('\r' + ' ' * 100)  # Clear line
-            sys.stdout.write(f'\r{Fore.LIGHTGREEN_EX}[{bar}] {progress:.1f}% '
-                           f'{Fore.LIGHTCYAN_EX}({self.completed_episodes}/{self.total_episodes}) '
-                           f'{Fore.LIGHTYELLOW_EX}ETA: {eta_str} '
-                           f'{Fore.LIGHTWHITE_EX}| {self.current_task}')
+            # Clear line and print progress in one write
+            sys.stdout.write(f'{self._CLEAR_LINE}{Fore.LIGHTGREEN_EX}[{bar}] {progress:.1f}% '
+                             f'{Fore.LIGHTCYAN_EX}({self.completed_episodes}/{self.total_episodes}) '
+                             f'{Fore.LIGHTYELLOW_EX}ETA: {eta_str} '
+                             f'{Fore.LIGHTWHITE_EX}| {self.current_task}{Style.RESET_ALL}')
             sys.stdout.flush()
     
     def _format_time(self, seconds: float) -> str:
@@ -90,12 +101,14 @@ class ProgressTracker:
         """Complete the progress tracking"""
         with self.lock:
             total_time = time.time() - self.start_time
-            print(f"\n{Fore.LIGHTGREEN_EX}✅ Download completed! "
-                  f"{Fore.LIGHTCYAN_EX}Total time: {self._format_time(total_time)}")
+            write_lines(f"\n{Fore.LIGHTGREEN_EX}✅ Download completed! "
+                        f"{Fore.LIGHTCYAN_EX}Total time: {self._format_time(total_time)}")
 
 class UserInterface:
     """Enhanced user interface for better interaction"""
     
+    Fore = Fore
+    
     @staticmethod
     def print_banner():
         """Print application banner"""
@@ -107,59 +120,67 @@ class UserInterface:
 {Fore.LIGHTCYAN_EX}║        {Fore.LIGHTYELLOW_EX}Fast • Reliable • User-Friendly{Fore.LIGHTCYAN_EX}                ║
 {Fore.LIGHTCYAN_EX}╚══════════════════════════════════════════════════════════════╝
         """
-        print(banner)
+        write_lines(banner)
     
     @staticmethod
     def print_section_header(title: str):
         """Print a section header"""
-        print(f"\n{Fore.LIGHTBLUE_EX}{'='*60}")
-        print(f"{Fore.LIGHTGREEN_EX} 📺 {title}")
-        print(f"{Fore.LIGHTBLUE_EX}{'='*60}")
+        rule = '=' * 60
+        write_lines(
+            f"\n{Fore.LIGHTBLUE_EX}{rule}",
+            f"{Fore.LIGHTGREEN_EX} 📺 {title}",
+            f"{Fore.LIGHTBLUE_EX}{rule}",
+        )
     
     @staticmethod
     def print_anime_info(anime):
         """Print anime information in a formatted way"""
-        print(f"\n{Fore.LIGHTGREEN_EX}📋 Selected Anime:")
-        print(f"{Fore.LIGHTCYAN_EX}   Name: {Fore.LIGHTWHITE_EX}{anime.name}")
-        print(f"{Fore.LIGHTCYAN_EX}   URL:  {Fore.LIGHTBLUE_EX}{anime.url}")
-        print(f"{Fore.LIGHTCYAN_EX}   Sub Episodes: {Fore.LIGHTYELLOW_EX}{anime.sub_episodes}")
-        print(f"{Fore.LIGHTCYAN_EX}   Dub Episodes: {Fore.LIGHTYELLOW_EX}{anime.dub_episodes}")
+        write_lines(
+            f"\n{Fore.LIGHTGREEN_EX}📋 Selected Anime:",
+            f"{Fore.LIGHTCYAN_EX}   Name: {Fore.LIGHTWHITE_EX}{anime.name}",
+            f"{Fore.LIGHTCYAN_EX}   URL:  {Fore.LIGHTBLUE_EX}{anime.url}",
+            f"{Fore.LIGHTCYAN_EX}   Sub Episodes: {Fore.LIGHTYELLOW_EX}{anime.sub_episodes}",
+            f"{Fore.LIGHTCYAN_EX}   Dub Episodes: {Fore.LIGHTYELLOW_EX}{anime.dub_episodes}",
+        )
     
     @staticmethod
     def print_download_info(anime, start_ep: int, end_ep: int, download_type: str):
         """Print download information"""
-        print(f"\n{Fore.LIGHTGREEN_EX}📥 Download Settings:")
-        print(f"{Fore.LIGHTCYAN_EX}   Type: {Fore.LIGHTYELLOW_EX}{download_type.upper()}")
-        print(f"{Fore.LIGHTCYAN_EX}   Episodes: {Fore.LIGHTYELLOW_EX}{start_ep} - {end_ep}")
-        print(f"{Fore.LIGHTCYAN_EX}   Total: {Fore.LIGHTYELLOW_EX}{end_ep - start_ep + 1} episodes")
+        write_lines(
+            f"\n{Fore.LIGHTGREEN_EX}📥 Download Settings:",
+            f"{Fore.LIGHTCYAN_EX}   Type: {Fore.LIGHTYELLOW_EX}{download_type.upper()}",
+            f"{Fore.LIGHTCYAN_EX}   Episodes: {Fore.LIGHTYELLOW_EX}{start_ep} - {end_ep}",
+            f"{Fore.LIGHTCYAN_EX}   Total: {Fore.LIGHTYELLOW_EX}{end_ep - start_ep + 1} episodes",
+        )
     
     @staticmethod
     def print_error(message: str):
         """Print error message"""
-        print(f"\n{Fore.LIGHTRED_EX}❌ Error: {message}")
+        write_lines(f"\n{Fore.LIGHTRED_EX}❌ Error: {message}")
     
     @staticmethod
     def print_warning(message: str):
         """Print warning message"""
-        print(f"\n{Fore.LIGHTYELLOW_EX}⚠️  Warning: {message}")
+        write_lines(f"\n{Fore.LIGHTYELLOW_EX}⚠️  Warning: {message}")
     
     @staticmethod
     def print_success(message: str):
         """Print success message"""
-        print(f"\n{Fore.LIGHTGREEN_EX}✅ {message}")
+        write_lines(f"\n{Fore.LIGHTGREEN_EX}✅ {message}")
     
     @staticmethod
     def print_info(message: str):
         """Print info message"""
-        print(f"\n{Fore.LIGHTCYAN_EX}ℹ️  {message}")
+        write_lines(f"\n{Fore.LIGHTCYAN_EX}ℹ️  {message}")
     
     @staticmethod
     def get_user_choice(prompt: str, options: List[str]) -> str:
         """Get user choice with validation"""
         while True:
-            print(f"\n{Fore.LIGHTCYAN_EX}{prompt}")
-            for i, option in enumerate(options, 1):
-                print(f"{Fore.LIGHTYELLOW_EX}  {i}. {option}")
+            write_lines(
+                f"\n{Fore.LIGHTCYAN_EX}{prompt}",
+                *(f"{Fore.LIGHTYELLOW_EX}  {i}. {option}" for i, option in enumerate(options, 1)),
+            )
             
             try:
                 choice = input(f"\n{Fore.LIGHTGREEN_EX}Enter your choice (1-{len(options)}): {Fore.LIGHTYELLOW_EX}")
@@ -193,6 +214,11 @@ class UserInterface:
                 print(f"\n{Fore.LIGHTRED_EX}Operation cancelled by user")
                 sys.exit(0)
 
+@functools.cache
+def get_ui() -> UserInterface:
+    """Get the shared UserInterface instance"""
+    return UserInterface()
+
 class NetworkStatusIndicator:
     """Show network status and connection health"""
     
@@ -202,19 +228,19 @@ class NetworkStatusIndicator:
     
     def show_connecting(self, url: str):
         """Show connecting status"""
-        print(f"{Fore.LIGHTYELLOW_EX}🔄 Connecting to {url[:50]}{'...' if len(url) > 50 else ''}")
+        write_lines(f"{Fore.LIGHTYELLOW_EX}🔄 Connecting to {url[:50]}{'...' if len(url) > 50 else ''}")
     
     def show_retry(self, attempt: int, max_attempts: int, error: str):
         """Show retry attempt"""
-        print(f"{Fore.LIGHTYELLOW_EX}🔄 Retry {attempt}/{max_attempts} - {error}")
+        write_lines(f"{Fore.LIGHTYELLOW_EX}🔄 Retry {attempt}/{max_attempts} - {error}")
     
     def show_success(self):
         """Show successful connection"""
-        print(f"{Fore.LIGHTGREEN_EX}✅ Connected successfully")
+        write_lines(f"{Fore.LIGHTGREEN_EX}✅ Connected successfully")
     
     def show_failure(self, error: str):
         """Show connection failure"""
-        print(f"{Fore.LIGHTRED_EX}❌ Connection failed: {error}")
+        write_lines(f"{Fore.LIGHTRED_EX}❌ Connection failed: {error}")
     
     def show_network_tips(self):
         """Show network troubleshooting tips"""
@@ -225,6 +251,7 @@ class NetworkStatusIndicator:
             "Check if the website is accessible in browser"
         ]
         
-        print(f"\n{Fore.LIGHTYELLOW_EX}💡 Network Troubleshooting Tips:")
-        for i, tip in enumerate(tips, 1):
-            print(f"{Fore.LIGHTCYAN_EX}   {i}. {tip}")
\ No newline at end of file
+        write_lines(
+            f"\n{Fore.LIGHTYELLOW_EX}💡 Network Troubleshooting Tips:",
+            *(f"{Fore.LIGHTCYAN_EX}   {i}. {tip}" for i, tip in enumerate(tips, 1)),
+        )
\ No newline at end of file